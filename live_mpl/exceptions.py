@@ -16,11 +16,17 @@ class InconsistentArrayShape(Exception):
     def __init__(self, x_shape: tuple[int, ...], y_shape: tuple[int, ...]):
         self.x_shape = x_shape
         self.y_shape = y_shape
-        self.message = (
+        super().__init__(x_shape, y_shape)
+
+    @property
+    def message(self) -> str:
+        return (
             f"Shape of x {self.x_shape} is not consistent "
             f"with the shape of y {self.y_shape}"
         )
-        super().__init__(self.message)
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class InvalidIterationAxis(Exception):
@@ -39,11 +45,17 @@ class InvalidIterationAxis(Exception):
     def __init__(self, iter_axis: int, num_dims: int):
         self.num_dims = num_dims
         self.iter_axis = iter_axis
-        self.message = (
+        super().__init__(iter_axis, num_dims)
+
+    @property
+    def message(self) -> str:
+        return (
             f"Iteration axis {self.iter_axis} is not valid "
             f"for data with dimension {self.num_dims}"
         )
-        super().__init__(self.message)
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class ArrayNot1D(Exception):
@@ -59,5 +71,11 @@ class ArrayNot1D(Exception):
 
     def __init__(self, ndim: int):
         self.ndim = ndim
-        self.message = f"Expected a 1D array, but got an array with {self.ndim}"
-        super().__init__(self.message)
+        super().__init__(ndim)
+
+    @property
+    def message(self) -> str:
+        return f"Expected a 1D array, but got an array with {self.ndim}"
+
+    def __str__(self) -> str:
+        return self.message
@@ -19,7 +19,37 @@ from matplotlib.axes import Axes
 _AXIS_SCALE_FACTOR = 0.05
 
 
-@dataclass
+def _nanmin2(a: float, b: float) -> float:
+    """
+    Return the smaller of two scalars, ignoring NaN.
+
+    Equivalent to ``np.nanmin([a, b])`` without building a temporary array.
+    If both values are NaN, NaN is returned.
+
+    """
+    if a != a:
+        return b
+    if b != b:
+        return a
+    return a if a < b else b
+
+
+def _nanmax2(a: float, b: float) -> float:
+    """
+    Return the larger of two scalars, ignoring NaN.
+
+    Equivalent to ``np.nanmax([a, b])`` without building a temporary array.
+    If both values are NaN, NaN is returned.
+
+    """
+    if a != a:
+        return b
+    if b != b:
+        return a
+    return a if a > b else b
+
+
+@dataclass(eq=False)
 class LiveBase(abc.ABC):
     """LiveBase
 
@@ -30,6 +60,12 @@ class LiveBase(abc.ABC):
     plotting classes are a wrapper around a matplotlib artist containing
     iterable data allowing the user to scroll through or animated the data.
 
+    Note
+    ----
+    `max_idx` is computed from `len_data` once and then cached. Subclasses
+    whose data length changes after construction must call
+    `invalidate_len_cache` so the new length is picked up.
+
     """
 
     ax: Axes
@@ -38,10 +74,22 @@ class LiveBase(abc.ABC):
     _idx: int = field(init=False, repr=False, default=0)
     """Current index of iterable data."""
 
+    _max_idx: int | None = field(init=False, repr=False, default=None)
+    """Cached maximum data index, computed lazily from `len_data`."""
+
+    _plotted_idx: int | None = field(init=False, repr=False, default=None)
+    """Data index the artists were last updated to."""
+
     @property
     @abc.abstractmethod
     def len_data(self) -> int:
-        """Length of iterable plot data."""
+        """
+        Length of iterable plot data.
+
+        This is read once and cached as `max_idx`. If the length changes after
+        construction, call `invalidate_len_cache` so the cache is refreshed.
+
+        """
 
     @property
     @abc.abstractmethod
@@ -67,6 +115,10 @@ class LiveBase(abc.ABC):
         """
         Method returning new data to plot.
 
+        This is called every time the plot index changes, so implementations
+        should store their data with the iteration axis first and return
+        views (e.g. ``self._data[self.current_idx]``) rather than copies.
+
         :meta public:
 
         Returns
@@ -103,10 +155,33 @@ class LiveBase(abc.ABC):
     @property
     def max_idx(self) -> int:
         """Maximum allowed plot data index."""
-        if self.len_data < 1:
-            return 0
+        if self._max_idx is None:
+            self._max_idx = max(0, self.len_data - 1)
+
+        return self._max_idx
+
+    def invalidate_len_cache(self):
+        """
+        Discard the cached maximum data index.
+
+        Subclasses that change the length of their data after construction
+        must call this so `max_idx` is recomputed from `len_data`. This also
+        calls `invalidate_plot_cache`.
 
-        return self.len_data - 1
+        """
+        self._max_idx = None
+        self.invalidate_plot_cache()
+
+    def invalidate_plot_cache(self):
+        """
+        Force the next plot update to refresh the artists.
+
+        Plot updates are skipped while the data index is unchanged. Subclasses
+        that change their data in place must call this so the current frame is
+        redrawn with the new data.
+
+        """
+        self._plotted_idx = None
 
     def _increment(self, step: int):
         """
@@ -118,10 +193,11 @@ class LiveBase(abc.ABC):
             Amount to increase data index
 
         """
+        max_idx = self.max_idx
         self._idx += step
 
-        if self._idx > self.max_idx:
-            self._idx = self.max_idx
+        if self._idx > max_idx:
+            self._idx = max_idx
 
     def _decrement(self, step: int):
         """
@@ -164,19 +240,20 @@ class LiveBase(abc.ABC):
         xl_ax, xr_ax = self.ax.get_xlim()
         yb_ax, yt_ax = self.ax.get_ylim()
 
-        if self.ax.xaxis_inverted():
-            xl = np.nanmax([xl, xl_ax])
-            xr = np.nanmin([xr, xr_ax])
+        # Same test as Axes.xaxis_inverted(), without re-querying the limits
+        if xr_ax < xl_ax:
+            xl = _nanmax2(xl, xl_ax)
+            xr = _nanmin2(xr, xr_ax)
         else:
-            xl = np.nanmin([xl, xl_ax])
-            xr = np.nanmax([xr, xr_ax])
+            xl = _nanmin2(xl, xl_ax)
+            xr = _nanmax2(xr, xr_ax)
 
-        if self.ax.yaxis_inverted():
-            yb = np.nanmax([yb, yb_ax])
-            yt = np.nanmin([yt, yt_ax])
+        if yt_ax < yb_ax:
+            yb = _nanmax2(yb, yb_ax)
+            yt = _nanmin2(yt, yt_ax)
         else:
-            yb = np.nanmin([yb, yb_ax])
-            yt = np.nanmax([yt, yt_ax])
+            yb = _nanmin2(yb, yb_ax)
+            yt = _nanmax2(yt, yt_ax)
 
         self.ax.set_xlim(left=xl, right=xr)
         self.ax.set_ylim(bottom=yb, top=yt)
@@ -191,8 +268,16 @@ class LiveBase(abc.ABC):
         Update plot by fetching new data and piping it to the appropriate
         `update_artist` method.
 
+        The update is skipped if the artists already show the current data
+        index, e.g. when stepping past either end of the data. Call
+        `invalidate_plot_cache` to force a refresh at the same index.
+
         """
+        if self._idx == self._plotted_idx:
+            return
+
         self._update_artists(*self._get_plot_data())
+        self._plotted_idx = self._idx
 
     def _animate_step(self, step: int):
         """
@@ -15,7 +15,7 @@ _T = np.ndarray
 _DEFAULT_KWARGS = (("marker", "*"),)
 
 
-@dataclass
+@dataclass(eq=False)
 class LiveLine(LiveBase):
     """
     .. _Line2D: https://matplotlib.org/stable/api/_as_gen/matplotlib.lines.Line2D.html # noqa: E501
@@ -68,35 +68,43 @@ class LiveLine(LiveBase):
     """
 
     _x: _T = field(init=False, repr=False)
-    """Post-processed x-data."""
+    """Post-processed C-contiguous x-data with the iteration axis first."""
     _y: _T = field(init=False, repr=False)
-    """Post-processed y-data."""
+    """Post-processed C-contiguous y-data with the iteration axis first."""
     _line: Line2D = field(init=False, repr=False)
     """Line artist rendering the actual plot."""
+    _limits: tuple[float, float, float, float] | None = field(
+        init=False, repr=False, default=None
+    )
+    """Axis limits spanning all of the data, computed once on first use."""
 
     @property
     def len_data(self):
-        return self._x.shape[self.iter_axis]
+        return self._x.shape[0]
 
     @property
     def artists(self) -> list[Artist]:
         return [self._line]
 
     def _update_artists(self, plot_x: _T, plot_y: _T):
-        try:
+        if self.callback_func is not None:
             self.callback_func(self._line, self._idx)
-        except TypeError:
-            pass
 
         self._line.set_data(plot_x, plot_y)
 
     def _get_plot_data(self) -> tuple[_T, ...]:
-        plot_x = self._x.take(indices=self.current_idx, axis=self.iter_axis)
-        plot_y = self._y.take(indices=self.current_idx, axis=self.iter_axis)
-        return plot_x, plot_y
+        return self._x[self.current_idx], self._y[self.current_idx]
 
     def _get_data_axis_limits(self) -> tuple[float, float, float, float]:
-        return np.min(self._x), np.max(self._x), np.min(self._y), np.max(self._y)
+        if self._limits is None:
+            self._limits = (
+                np.min(self._x),
+                np.max(self._x),
+                np.min(self._y),
+                np.max(self._y),
+            )
+
+        return self._limits
 
     def _validate_data(self, x_data: _T, y_data: _T):
         if not x_data.shape == y_data.shape:
@@ -108,11 +116,17 @@ class LiveLine(LiveBase):
         x_data = np.atleast_2d(x_data)
         y_data = np.atleast_2d(y_data)
 
-        if np.atleast_1d(x_data.squeeze()).ndim == 1:
+        # Data with at most one non-singleton dimension can only iterate on axis 0
+        if sum(dim != 1 for dim in x_data.shape) <= 1:
             self.iter_axis = 0
 
         self._validate_data(x_data, y_data)
-        self._x, self._y = x_data, y_data
+        # Copy once so that each frame is a contiguous block of memory. Copying
+        # with ndarray.copy keeps array subclasses such as masked arrays.
+        x_data = np.moveaxis(x_data, self.iter_axis, 0)
+        y_data = np.moveaxis(y_data, self.iter_axis, 0)
+        self._x = x_data if x_data.flags.c_contiguous else x_data.copy(order="C")
+        self._y = y_data if y_data.flags.c_contiguous else y_data.copy(order="C")
 
         full_kwargs = {key: val for key, val in _DEFAULT_KWARGS}
         if plot_kwargs:
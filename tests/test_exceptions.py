@@ -0,0 +1,42 @@
+"""
+Tests for the live_mpl custom exceptions.
+
+Importing live_mpl requires the GTK bindings (PyGObject), so these tests are
+skipped when they are not installed.
+
+"""
+
+import pickle
+
+import pytest
+
+pytest.importorskip("gi")
+
+from live_mpl.exceptions import (  # noqa: E402 - requires GTK bindings
+    ArrayNot1D,
+    InconsistentArrayShape,
+    InvalidIterationAxis,
+)
+
+
+@pytest.mark.parametrize(
+    "exc, message",
+    [
+        (
+            InconsistentArrayShape(x_shape=(2,), y_shape=(3,)),
+            "Shape of x (2,) is not consistent with the shape of y (3,)",
+        ),
+        (
+            InvalidIterationAxis(iter_axis=3, num_dims=2),
+            "Iteration axis 3 is not valid for data with dimension 2",
+        ),
+        (ArrayNot1D(ndim=2), "Expected a 1D array, but got an array with 2"),
+    ],
+)
+def test_exception_message(exc, message):
+    assert exc.message == message
+    assert str(exc) == message
+
+    unpickled = pickle.loads(pickle.dumps(exc))
+    assert type(unpickled) is type(exc)
+    assert str(unpickled) == message
@@ -0,0 +1,112 @@
+"""
+Tests for the LiveBase abstract class.
+
+Importing live_mpl requires the GTK bindings (PyGObject), so these tests are
+skipped when they are not installed.
+
+"""
+
+import warnings
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+from matplotlib.figure import Figure
+
+pytest.importorskip("gi")
+
+from live_mpl import LiveBase  # noqa: E402 - requires GTK bindings
+from live_mpl.live_base import _nanmax2, _nanmin2  # noqa: E402
+
+
+@dataclass
+class _CounterPlot(LiveBase):
+    """Minimal plain dataclass subclass recording the indices it plots."""
+
+    num_points: int = 3
+
+    def __post_init__(self):
+        self.plotted = []
+
+    @property
+    def len_data(self) -> int:
+        return self.num_points
+
+    @property
+    def artists(self):
+        return []
+
+    def _update_artists(self, idx):
+        self.plotted.append(idx)
+
+    def _get_plot_data(self):
+        return (self.current_idx,)
+
+    def _get_data_axis_limits(self):
+        return 0.0, 1.0, 0.0, 1.0
+
+
+def test_plain_dataclass_subclass_steps():
+    plot = _CounterPlot(ax=Figure().add_subplot())
+
+    assert plot.current_idx == 0
+    for _ in range(plot.num_points + 1):
+        plot._animate_step(1)
+
+    assert plot.current_idx == plot.max_idx == 2
+    assert plot.plotted == [1, 2]
+
+    plot._decrement(5)
+    plot._update_plot()
+    assert plot.current_idx == 0
+    assert plot.plotted == [1, 2, 0]
+
+
+
+@pytest.mark.parametrize("a", [1.0, -2.0, np.nan, np.float32(0.5)])
+@pytest.mark.parametrize("b", [1.0, 3.0, np.nan, np.float64(-4.0)])
+def test_nan_helpers_match_numpy(a, b):
+    with warnings.catch_warnings():
+        # All-NaN input makes numpy warn before returning NaN
+        warnings.simplefilter("ignore", RuntimeWarning)
+        expected_min = np.nanmin([a, b])
+        expected_max = np.nanmax([a, b])
+
+    np.testing.assert_equal(_nanmin2(a, b), expected_min)
+    np.testing.assert_equal(_nanmax2(a, b), expected_max)
+
+
+def test_max_idx_cached_until_invalidated():
+    plot = _CounterPlot(ax=Figure().add_subplot(), num_points=3)
+    assert plot.max_idx == 2
+
+    plot.num_points = 5
+    plot._jump_to_end()
+    assert plot.current_idx == 2
+
+    plot.invalidate_len_cache()
+    plot._jump_to_end()
+    assert plot.current_idx == plot.max_idx == 4
+
+
+def test_max_idx_of_empty_data_is_zero():
+    plot = _CounterPlot(ax=Figure().add_subplot(), num_points=0)
+
+    plot._increment(1)
+    assert plot.max_idx == plot.current_idx == 0
+
+
+def test_update_skipped_until_index_changes_or_cache_invalidated():
+    plot = _CounterPlot(ax=Figure().add_subplot(), num_points=2)
+
+    plot._update_plot()
+    plot._update_plot()
+    assert plot.plotted == [0]
+
+    plot._animate_step(1)
+    plot._animate_step(1)
+    assert plot.plotted == [0, 1]
+
+    plot.invalidate_plot_cache()
+    plot._update_plot()
+    assert plot.plotted == [0, 1, 1]
@@ -0,0 +1,69 @@
+"""
+Tests for the LiveLine class.
+
+Importing live_mpl requires the GTK bindings (PyGObject), so these tests are
+skipped when they are not installed.
+
+"""
+
+import numpy as np
+import pytest
+from matplotlib.figure import Figure
+
+pytest.importorskip("gi")
+
+from live_mpl import LiveLine  # noqa: E402 - requires GTK bindings
+
+
+@pytest.mark.parametrize("iter_axis", [0, 1])
+def test_masked_data_keeps_mask(iter_axis):
+    data = np.ma.masked_values([[0.0, 1.0, 1e6], [3.0, 4.0, 5.0]], 1e6)
+    if iter_axis == 1:
+        data = data.T
+
+    ax = Figure().add_subplot()
+    plot = LiveLine(ax=ax, x_data=data, y_data=data, iter_axis=iter_axis)
+
+    plot_x, plot_y = plot._get_plot_data()
+    assert np.ma.isMaskedArray(plot_x)
+    assert plot_x.mask.tolist() == [False, False, True]
+    assert plot._get_data_axis_limits() == (0.0, 5.0, 0.0, 5.0)
+
+
+@pytest.mark.parametrize("iter_axis", [0, 1])
+def test_frames_are_contiguous_views(iter_axis):
+    x_data = np.arange(12.0).reshape(3, 4)
+    y_data = x_data**2
+
+    ax = Figure().add_subplot()
+    plot = LiveLine(ax=ax, x_data=x_data, y_data=y_data, iter_axis=iter_axis)
+
+    assert plot.len_data == x_data.shape[iter_axis]
+    for idx in range(plot.len_data):
+        plot._jump_to_beginning()
+        plot._increment(idx)
+        plot_x, plot_y = plot._get_plot_data()
+        assert plot_x.flags.c_contiguous and plot_x.base is not None
+        np.testing.assert_array_equal(plot_x, x_data.take(idx, axis=iter_axis))
+        np.testing.assert_array_equal(plot_y, y_data.take(idx, axis=iter_axis))
+
+
+def test_empty_data_constructs_and_steps():
+    ax = Figure().add_subplot()
+    plot = LiveLine(ax=ax, x_data=np.array([]), y_data=np.array([]))
+
+    plot._animate_step(1)
+    assert plot.current_idx == 0
+    assert plot._get_plot_data()[0].size == 0
+
+
+def test_categorical_x_data_constructs_and_steps():
+    x_data = np.array([["a", "b", "c"], ["a", "b", "c"]])
+    y_data = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+    ax = Figure().add_subplot()
+    plot = LiveLine(ax=ax, x_data=x_data, y_data=y_data)
+
+    plot._animate_step(1)
+    assert plot.current_idx == 1
+    assert plot._get_plot_data()[0].tolist() == ["a", "b", "c"]